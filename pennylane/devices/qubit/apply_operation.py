@@ -523,6 +523,54 @@ def apply_cnot(op: qml.CNOT, state, is_state_batched: bool = False, debugger=Non
     return math.stack([state[sl_0], state_x], axis=control_axes)
 
 
+@apply_operation.register
+def apply_controlled_phase_shift(
+    op: qml.ControlledPhaseShift, state, is_state_batched: bool = False, debugger=None, **_
+):
+    r"""Apply ControlledPhaseShift to state by only multiplying the amplitudes where both
+    wires are in the :math:`|1\rangle` state with the phase."""
+    n_dim = math.ndim(state)
+    interface = math.get_interface(state)
+
+    if n_dim >= 9 and interface == "tensorflow":
+        if op.batch_size is None:
+            return apply_operation_tensordot(op, state, is_state_batched=is_state_batched)
+        return _apply_operation_default(op, state, is_state_batched, debugger)
+
+    phase = math.exp(1.0j * math.cast(op.parameters[0], dtype=complex))
+    if op.batch_size is not None:
+        if interface == "torch" and math.get_interface(phase) != "torch":
+            # place NumPy phases on the device of the state
+            phase = math.array(phase, like=state)
+        if not is_state_batched:
+            # repeat the state along a new leading axis, once for each phase
+            state = math.stack([state] * op.batch_size)
+            is_state_batched = True
+            n_dim += 1
+        # align the phases with the leading batch axis of the amplitudes they multiply
+        phase = math.reshape(phase, (-1,) + (1,) * (n_dim - 3))
+
+    if "complex" not in math.get_dtype_name(state):
+        state = math.cast(state, complex)
+    # keep the precision of the state, so that all slices stacked below share its dtype
+    phase = math.cast_like(phase, state)
+
+    control_axis = op.wires[0] + is_state_batched
+    # the target axis within the slice of the state where the control is 1
+    target_axis = (op.wires[1] - 1 if op.wires[1] > op.wires[0] else op.wires[1]) + is_state_batched
+
+    sl_0 = _get_slice(0, control_axis, n_dim)
+    sl_1 = _get_slice(1, control_axis, n_dim)
+    state_1 = state[sl_1]
+
+    sl_10 = _get_slice(0, target_axis, n_dim - 1)
+    sl_11 = _get_slice(1, target_axis, n_dim - 1)
+
+    state_11 = math.multiply(state_1[sl_11], phase)
+    state_1 = math.stack([state_1[sl_10], state_11], axis=target_axis)
+    return math.stack([state[sl_0], state_1], axis=control_axis)
+
+
 @apply_operation.register
 def apply_multicontrolledx(
     op: qml.MultiControlledX,
@@ -577,6 +625,66 @@ def apply_multicontrolledx(
     return state
 
 
+@apply_operation.register
+def apply_controlled_qubit_unitary(
+    op: qml.ControlledQubitUnitary,
+    state,
+    is_state_batched: bool = False,
+    debugger=None,
+    **_,
+):
+    r"""Apply ControlledQubitUnitary to a state with the default einsum/tensordot choice
+    for 8 operation wires or less, or if the unitary is broadcasted. Otherwise, apply a
+    custom kernel that contracts the target unitary with the controlled block of the state
+    only, without constructing the full controlled matrix."""
+    if len(op.wires) < 9 or op.batch_size is not None:
+        return _apply_operation_default(op, state, is_state_batched, debugger)
+    ctrl_wires = [w + is_state_batched for w in op.control_wires]
+    # apply x on all control wires with control value 0
+    roll_axes = [w for val, w in zip(op.control_values, ctrl_wires) if not val]
+    for ax in roll_axes:
+        state = math.roll(state, 1, ax)
+
+    target_wires = op.base.wires
+    orig_shape = math.shape(state)
+    # Move the axes into the order [(batch), other, targets, controls]
+    transpose_axes = (
+        np.array(
+            [
+                w - is_state_batched
+                for w in range(len(orig_shape))
+                if w - is_state_batched not in op.wires
+            ]
+            + target_wires.tolist()
+            + op.control_wires.tolist()
+        )
+        + is_state_batched
+    )
+    state = math.transpose(state, transpose_axes)
+
+    # Reshape the state into 3-dimensional array with axes [batch+other, targets, controls]
+    dim = 2 ** len(target_wires)
+    state = math.reshape(state, (-1, dim, 2 ** len(op.control_wires)))
+
+    mat = math.cast_like(op.base.matrix(), state)
+
+    # The part of the state to which we want to apply the unitary is now in the last entry
+    # along the third axis. Extract it, contract it with the unitary along the target axis (1)
+    # and append a dummy axis
+    state_u = math.einsum("ij,bj->bi", mat, state[:, :, -1])[:, :, np.newaxis]
+
+    # Stack the transformed part of the state with the unmodified rest of the state
+    state = math.concatenate([state[:, :, :-1], state_u], axis=2)
+
+    # Reshape into original shape and undo the transposition
+    state = math.transpose(math.reshape(state, orig_shape), np.argsort(transpose_axes))
+
+    # revert x on all "wrong" controls
+    for ax in roll_axes:
+        state = math.roll(state, 1, ax)
+    return state
+
+
 @apply_operation.register
 def apply_grover(
     op: qml.GroverOperator,
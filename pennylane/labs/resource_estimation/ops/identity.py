@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 r"""Resource operators for identity operations."""
+from functools import lru_cache
 from typing import Dict
 
 import pennylane as qml
@@ -31,6 +32,7 @@ class ResourceIdentity(qml.Identity, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, **kwargs) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -60,6 +62,7 @@ class ResourceGlobalPhase(qml.GlobalPhase, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, **kwargs) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 r"""Resource operators for controlled operations."""
+from functools import lru_cache
 from typing import Dict
 
 import pennylane as qml
@@ -56,6 +57,7 @@ class ResourceCH(qml.CH, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -108,6 +110,7 @@ class ResourceCY(qml.CY, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -158,6 +161,7 @@ class ResourceCZ(qml.CZ, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -218,6 +222,7 @@ class ResourceCSWAP(qml.CSWAP, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -267,6 +272,7 @@ class ResourceCCZ(qml.CCZ, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -305,6 +311,7 @@ class ResourceCNOT(qml.CNOT, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -406,6 +413,7 @@ class ResourceToffoli(qml.Toffoli, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -494,6 +502,7 @@ class ResourceMultiControlledX(qml.MultiControlledX, re.ResourceOperator):
         }
 
     @classmethod
+    @lru_cache()
     def resource_rep(
         cls, num_ctrl_wires, num_ctrl_values, num_work_wires
     ) -> re.CompressedResourceOp:
@@ -571,6 +580,7 @@ class ResourceCRX(qml.CRX, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -624,6 +634,7 @@ class ResourceCRY(qml.CRY, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -677,6 +688,7 @@ class ResourceCRZ(qml.CRZ, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -741,6 +753,7 @@ class ResourceCRot(qml.CRot, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -791,6 +804,7 @@ class ResourceControlledPhaseShift(qml.ControlledPhaseShift, re.ResourceOperator
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
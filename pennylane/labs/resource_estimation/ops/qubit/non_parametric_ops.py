@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 r"""Resource operators for non parametric single qubit operations."""
+from functools import lru_cache
 from typing import Dict
 
 import pennylane as qml
@@ -31,6 +32,7 @@ class ResourceHadamard(qml.Hadamard, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -80,6 +82,7 @@ class ResourceS(qml.S, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -159,6 +162,7 @@ class ResourceSWAP(qml.SWAP, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -204,6 +208,7 @@ class ResourceT(qml.T, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -256,6 +261,7 @@ class ResourceX(qml.X, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -322,6 +328,7 @@ class ResourceY(qml.Y, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -372,6 +379,7 @@ class ResourceZ(qml.Z, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
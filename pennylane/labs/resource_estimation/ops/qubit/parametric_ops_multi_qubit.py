@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 r"""Resource operators for parametric multi qubit operations."""
+from functools import lru_cache
 from typing import Dict
 
 import pennylane as qml
@@ -46,6 +47,7 @@ class ResourceMultiRZ(qml.MultiRZ, re.ResourceOperator):
         return {"num_wires": len(self.wires)}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, num_wires):
         return re.CompressedResourceOp(cls, {"num_wires": num_wires})
 
@@ -155,6 +157,7 @@ class ResourcePauliRot(qml.PauliRot, re.ResourceOperator):
         }
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, pauli_string):
         return re.CompressedResourceOp(cls, {"pauli_string": pauli_string})
 
@@ -236,6 +239,7 @@ class ResourceIsingXX(qml.IsingXX, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -308,6 +312,7 @@ class ResourceIsingYY(qml.IsingYY, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -384,6 +389,7 @@ class ResourceIsingXY(qml.IsingXY, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -466,6 +472,7 @@ class ResourceIsingZZ(qml.IsingZZ, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -537,6 +544,7 @@ class ResourcePSWAP(qml.PSWAP, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
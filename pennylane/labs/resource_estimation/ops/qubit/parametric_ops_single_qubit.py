@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 r"""Resource operators for parametric single qubit operations."""
+import math
+from functools import lru_cache
 from typing import Dict
 
-import numpy as np
-
 import pennylane as qml
 import pennylane.labs.resource_estimation as re
 
@@ -26,7 +26,7 @@ def _rotation_resources(epsilon=10e-3):
     """An estimate on the number of T gates needed to implement a Pauli rotation. The estimate is taken from https://arxiv.org/abs/1404.5320."""
     gate_types = {}
 
-    num_gates = round(1.149 * np.log2(1 / epsilon) + 9.2)
+    num_gates = round(1.149 * math.log2(1 / epsilon) + 9.2)
     t = re.ResourceT.resource_rep()
     gate_types[t] = num_gates
 
@@ -59,6 +59,7 @@ class ResourcePhaseShift(qml.PhaseShift, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -113,6 +114,7 @@ class ResourceRX(qml.RX, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -183,6 +185,7 @@ class ResourceRY(qml.RY, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -245,6 +248,7 @@ class ResourceRZ(qml.RZ, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -305,6 +309,7 @@ class ResourceRot(qml.Rot, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls) -> re.CompressedResourceOp:
         return re.CompressedResourceOp(cls, {})
 
@@ -10,6 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 r"""Resource operators for qchem operations."""
+from functools import lru_cache
+
 import pennylane as qml
 import pennylane.labs.resource_estimation as re
 
@@ -58,6 +60,7 @@ class ResourceSingleExcitation(qml.SingleExcitation, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -102,6 +105,7 @@ class ResourceSingleExcitationMinus(qml.SingleExcitationMinus, re.ResourceOperat
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -146,6 +150,7 @@ class ResourceSingleExcitationPlus(qml.SingleExcitationPlus, re.ResourceOperator
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -191,6 +196,7 @@ class ResourceDoubleExcitation(qml.DoubleExcitation, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -228,6 +234,7 @@ class ResourceDoubleExcitationMinus(qml.DoubleExcitationMinus, re.ResourceOperat
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -264,6 +271,7 @@ class ResourceDoubleExcitationPlus(qml.DoubleExcitationPlus, re.ResourceOperator
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -294,6 +302,7 @@ class ResourceOrbitalRotation(qml.OrbitalRotation, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
 
@@ -340,5 +349,6 @@ class ResourceFermionicSWAP(qml.FermionicSWAP, re.ResourceOperator):
         return {}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls):
         return re.CompressedResourceOp(cls, {})
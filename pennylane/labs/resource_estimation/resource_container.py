@@ -62,9 +62,12 @@ class CompressedResourceOp:
         self.params = params
         self._hashable_params = _make_hashable(params)
         self._name = name or op_type.tracking_name(**params)
+        self._hash = None
 
     def __hash__(self) -> int:
-        return hash((self._name, self._hashable_params))
+        if self._hash is None:
+            self._hash = hash((self._name, self._hashable_params))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         return (self.op_type == other.op_type) and (self.params == other.params)
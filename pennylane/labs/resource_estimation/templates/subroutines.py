@@ -13,6 +13,8 @@
 # limitations under the License.
 r"""Resource operators for PennyLane subroutine templates."""
 from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict
 
 import pennylane as qml
@@ -34,22 +36,13 @@ class ResourceQFT(qml.QFT, ResourceOperator):
 
     @staticmethod
     def _resource_decomp(num_wires, **kwargs) -> Dict[CompressedResourceOp, int]:
-        gate_types = {}
-
-        hadamard = re.ResourceHadamard.resource_rep()
-        swap = re.ResourceSWAP.resource_rep()
-        ctrl_phase_shift = re.ResourceControlledPhaseShift.resource_rep()
-
-        gate_types[hadamard] = num_wires
-        gate_types[swap] = num_wires // 2
-        gate_types[ctrl_phase_shift] = num_wires * (num_wires - 1) // 2
-
-        return gate_types
+        return dict(_qft_resources(num_wires))
 
     def resource_params(self) -> dict:
         return {"num_wires": len(self.wires)}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, num_wires) -> CompressedResourceOp:
         params = {"num_wires": num_wires}
         return CompressedResourceOp(cls, params)
@@ -59,6 +52,23 @@ class ResourceQFT(qml.QFT, ResourceOperator):
         return f"QFT({num_wires})"
 
 
+@lru_cache()
+def _qft_resources(num_wires) -> Dict[CompressedResourceOp, int]:
+    """The gate counts of QFT on ``num_wires`` wires. The cached result is a read-only mapping;
+    callers receive copies of it."""
+    gate_types = {}
+
+    hadamard = re.ResourceHadamard.resource_rep()
+    swap = re.ResourceSWAP.resource_rep()
+    ctrl_phase_shift = re.ResourceControlledPhaseShift.resource_rep()
+
+    gate_types[hadamard] = num_wires
+    gate_types[swap] = num_wires // 2
+    gate_types[ctrl_phase_shift] = num_wires * (num_wires - 1) // 2
+
+    return MappingProxyType(gate_types)
+
+
 class ResourceQuantumPhaseEstimation(qml.QuantumPhaseEstimation, ResourceOperator):
     """Resource class for QPE"""
 
@@ -149,6 +159,7 @@ class ResourceStatePrep(qml.StatePrep, ResourceOperator):
         return {"num_wires": len(self.wires)}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, num_wires) -> CompressedResourceOp:
         params = {"num_wires": num_wires}
         return CompressedResourceOp(cls, params)
@@ -179,6 +190,7 @@ class ResourceBasisRotation(qml.BasisRotation, ResourceOperator):
         return {"dim_N": qml.math.shape(unitary_matrix)[0]}
 
     @classmethod
+    @lru_cache()
     def resource_rep(cls, dim_N) -> CompressedResourceOp:
         params = {"dim_N": dim_N}
         return CompressedResourceOp(cls, params)
@@ -14,6 +14,7 @@
 """
 Tests for symbolic resource operators.
 """
+import copy
 
 import pytest
 
@@ -234,6 +235,18 @@ class TestResourceControlled:
         """Test that the resources are correct"""
         assert op.resource_params() == expected
 
+    def test_resource_params_of_copy_with_new_control_values(self):
+        """Test that the resource params of a copy reflect its updated hyperparameters"""
+        op = re.ResourceControlled(
+            re.ResourceQFT([0, 1]), control_wires=[2, 3], control_values=[0, 1]
+        )
+        assert op.resource_params()["num_ctrl_values"] == 1
+
+        new_op = copy.copy(op)
+        new_op.hyperparameters["control_values"] = [1, 1]
+        assert new_op.resource_params()["num_ctrl_values"] == 0
+        assert op.resource_params()["num_ctrl_values"] == 1
+
     expected_names = [
         "C(QFT(2),1,0,0)",
         "C(C(QFT(2),1,0,0),1,0,0)",
@@ -21,81 +21,397 @@ import pennylane.labs.resource_estimation as re
 # pylint: disable=no-self-use,use-implicit-booleaness-not-comparison
 
 
-class TestHadamard:
-    """Tests for ResourceHadamard"""
-
-    def test_resources(self):
-        """Test that ResourceHadamard does not implement a decomposition"""
-        op = re.ResourceHadamard(0)
-        with pytest.raises(re.ResourcesNotDefined):
-            op.resources()
-
-    def test_resource_params(self):
+non_parametric_ops = (
+    re.ResourceHadamard(0),
+    re.ResourceSWAP([0, 1]),
+    re.ResourceS(0),
+    re.ResourceT(0),
+    re.ResourceX(0),
+    re.ResourceY(0),
+    re.ResourceZ(0),
+)
+
+ctrl_data = (
+    (
+        re.ResourceHadamard(0),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceCH.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceHadamard(0),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceCH.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceHadamard(0),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceCH.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
+        },
+    ),
+    (
+        re.ResourceHadamard(0),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceCH.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
+        },
+    ),
+    (
+        re.ResourceSWAP([0, 1]),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceCSWAP.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceSWAP([0, 1]),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceCSWAP.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceSWAP([0, 1]),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceCNOT.resource_rep(): 2,
+            re.ResourceMultiControlledX.resource_rep(2, 0, 1): 1,
+        },
+    ),
+    (
+        re.ResourceSWAP([0, 1]),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceCNOT.resource_rep(): 2,
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 1,
+        },
+    ),
+    (
+        re.ResourceS(0),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceS(0),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceS(0),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
+        },
+    ),
+    (
+        re.ResourceS(0),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
+        },
+    ),
+    (
+        re.ResourceT(0),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceT(0),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceT(0),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
+        },
+    ),
+    (
+        re.ResourceT(0),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceControlledPhaseShift.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
+        },
+    ),
+    (
+        re.ResourceX(0),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceCNOT.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceX(0),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceCNOT.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceX(0),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceToffoli.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceX(0),
+        ["c1", "c2"],
+        [0, 0],
+        ["w1"],
+        {
+            re.ResourceToffoli.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 4,
+        },
+    ),
+    (
+        re.ResourceX(0),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 1,
+        },
+    ),
+    (
+        re.ResourceX(0),
+        ["c1", "c2", "c3", "c4"],
+        [1, 0, 0, 1],
+        ["w1", "w2"],
+        {
+            re.ResourceMultiControlledX.resource_rep(4, 2, 2): 1,
+        },
+    ),
+    (
+        re.ResourceY(0),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceCY.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceY(0),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceCY.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceY(0),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceCY.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
+        },
+    ),
+    (
+        re.ResourceY(0),
+        ["c1", "c2"],
+        [0, 0],
+        ["w1"],
+        {
+            re.ResourceCY.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(2, 2, 1): 2,
+        },
+    ),
+    (
+        re.ResourceY(0),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceCY.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
+        },
+    ),
+    (
+        re.ResourceZ(0),
+        ["c1"],
+        [1],
+        [],
+        {
+            re.ResourceCZ.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceZ(0),
+        ["c1"],
+        [0],
+        [],
+        {
+            re.ResourceCZ.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 2,
+        },
+    ),
+    (
+        re.ResourceZ(0),
+        ["c1", "c2"],
+        [1, 1],
+        ["w1"],
+        {
+            re.ResourceCCZ.resource_rep(): 1,
+        },
+    ),
+    (
+        re.ResourceZ(0),
+        ["c1", "c2"],
+        [0, 0],
+        ["w1"],
+        {
+            re.ResourceCCZ.resource_rep(): 1,
+            re.ResourceX.resource_rep(): 4,
+        },
+    ),
+    (
+        re.ResourceZ(0),
+        ["c1", "c2", "c3"],
+        [1, 0, 0],
+        ["w1", "w2"],
+        {
+            re.ResourceCZ.resource_rep(): 1,
+            re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
+        },
+    ),
+)
+
+pow_data = (
+    (re.ResourceHadamard(0), 1, {re.ResourceHadamard.resource_rep(): 1}),
+    (re.ResourceHadamard(0), 2, {}),
+    (re.ResourceHadamard(0), 3, {re.ResourceHadamard.resource_rep(): 1}),
+    (re.ResourceHadamard(0), 4, {}),
+    (re.ResourceSWAP([0, 1]), 1, {re.ResourceSWAP.resource_rep(): 1}),
+    (re.ResourceSWAP([0, 1]), 2, {}),
+    (re.ResourceSWAP([0, 1]), 3, {re.ResourceSWAP.resource_rep(): 1}),
+    (re.ResourceSWAP([0, 1]), 4, {}),
+    (re.ResourceS(0), 1, {re.ResourceS.resource_rep(): 1}),
+    (re.ResourceS(0), 2, {re.ResourceS.resource_rep(): 2}),
+    (re.ResourceS(0), 3, {re.ResourceS.resource_rep(): 3}),
+    (re.ResourceS(0), 4, {}),
+    (re.ResourceS(0), 7, {re.ResourceS.resource_rep(): 3}),
+    (re.ResourceS(0), 8, {}),
+    (re.ResourceS(0), 14, {re.ResourceS.resource_rep(): 2}),
+    (re.ResourceS(0), 15, {re.ResourceS.resource_rep(): 3}),
+    (re.ResourceT(0), 1, {re.ResourceT.resource_rep(): 1}),
+    (re.ResourceT(0), 2, {re.ResourceT.resource_rep(): 2}),
+    (re.ResourceT(0), 3, {re.ResourceT.resource_rep(): 3}),
+    (re.ResourceT(0), 7, {re.ResourceT.resource_rep(): 7}),
+    (re.ResourceT(0), 8, {}),
+    (re.ResourceT(0), 14, {re.ResourceT.resource_rep(): 6}),
+    (re.ResourceT(0), 15, {re.ResourceT.resource_rep(): 7}),
+    (re.ResourceT(0), 16, {}),
+    (re.ResourceX(0), 1, {re.ResourceX.resource_rep(): 1}),
+    (re.ResourceX(0), 2, {}),
+    (re.ResourceX(0), 3, {re.ResourceX.resource_rep(): 1}),
+    (re.ResourceX(0), 4, {}),
+    (re.ResourceY(0), 1, {re.ResourceY.resource_rep(): 1}),
+    (re.ResourceY(0), 2, {}),
+    (re.ResourceY(0), 3, {re.ResourceY.resource_rep(): 1}),
+    (re.ResourceY(0), 4, {}),
+    (re.ResourceZ(0), 1, {re.ResourceZ.resource_rep(): 1}),
+    (re.ResourceZ(0), 2, {}),
+    (re.ResourceZ(0), 3, {re.ResourceZ.resource_rep(): 1}),
+    (re.ResourceZ(0), 4, {}),
+)
+
+
+class TestNonParametricOps:
+    """Tests shared by all non parametric resource operators"""
+
+    @pytest.mark.parametrize("op", non_parametric_ops)
+    def test_resource_params(self, op):
         """Test that the resource params are correct"""
-        op = re.ResourceHadamard(0)
         assert op.resource_params() == {}
 
-    def test_resource_rep(self):
+    @pytest.mark.parametrize("op", non_parametric_ops)
+    def test_resource_rep(self, op):
         """Test that the compact representation is correct"""
-        expected = re.CompressedResourceOp(re.ResourceHadamard, {})
-        assert re.ResourceHadamard.resource_rep() == expected
-
-    def test_adjoint_decomp(self):
-        """Test that the adjoint decomposition is correct."""
-        h = re.ResourceHadamard(0)
-        h_dag = re.ResourceAdjoint(re.ResourceHadamard(0))
+        expected = re.CompressedResourceOp(type(op), {})
+        assert type(op).resource_rep() == expected
 
-        assert re.get_resources(h) == re.get_resources(h_dag)
-
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceCH.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceCH.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceCH.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceCH.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
-            },
-        ),
-    )
+    @pytest.mark.parametrize("op", non_parametric_ops)
+    def test_resource_rep_cached(self, op):
+        """Test that the compact representation is only instantiated once"""
+        assert type(op).resource_rep() is type(op).resource_rep()
 
     @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
+        "op, ctrl_wires, ctrl_values, work_wires, expected_res",
         ctrl_data,
     )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
+    def test_resource_controlled(self, op, ctrl_wires, ctrl_values, work_wires, expected_res):
         """Test that the controlled resources are as expected"""
         num_ctrl_wires = len(ctrl_wires)
         num_ctrl_values = len([v for v in ctrl_values if not v])
         num_work_wires = len(work_wires)
 
-        op = re.ResourceHadamard(0)
         op2 = re.ResourceControlled(
             op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
         )
@@ -106,23 +422,32 @@ class TestHadamard:
         )
         assert op2.resources(**op2.resource_params()) == expected_res
 
-    pow_data = (
-        (1, {re.ResourceHadamard.resource_rep(): 1}),
-        (2, {}),
-        (3, {re.ResourceHadamard.resource_rep(): 1}),
-        (4, {}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
+    @pytest.mark.parametrize("op, z, expected_res", pow_data)
+    def test_pow_decomp(self, op, z, expected_res):
         """Test that the pow decomposition is correct."""
-        op = re.ResourceHadamard(0)
         assert op.pow_resource_decomp(z) == expected_res
 
         op2 = re.ResourcePow(op, z)
         assert op2.resources(**op2.resource_params()) == expected_res
 
 
+class TestHadamard:
+    """Tests for ResourceHadamard"""
+
+    def test_resources(self):
+        """Test that ResourceHadamard does not implement a decomposition"""
+        op = re.ResourceHadamard(0)
+        with pytest.raises(re.ResourcesNotDefined):
+            op.resources()
+
+    def test_adjoint_decomp(self):
+        """Test that the adjoint decomposition is correct."""
+        h = re.ResourceHadamard(0)
+        h_dag = re.ResourceAdjoint(re.ResourceHadamard(0))
+
+        assert re.get_resources(h) == re.get_resources(h_dag)
+
+
 class TestSWAP:
     """Tests for ResourceSWAP"""
 
@@ -134,16 +459,6 @@ class TestSWAP:
 
         assert op.resources() == expected
 
-    def test_resource_params(self):
-        """Test that the resource params are correct"""
-        op = re.ResourceSWAP([0, 1])
-        assert op.resource_params() == {}
-
-    def test_resource_rep(self):
-        """Test the compact representation"""
-        expected = re.CompressedResourceOp(re.ResourceSWAP, {})
-        assert re.ResourceSWAP.resource_rep() == expected
-
     def test_resources_from_rep(self):
         """Test that the resources can be computed from the compressed representation"""
 
@@ -162,81 +477,6 @@ class TestSWAP:
 
         assert re.get_resources(swap) == re.get_resources(swap_dag)
 
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceCSWAP.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceCSWAP.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceCNOT.resource_rep(): 2,
-                re.ResourceMultiControlledX.resource_rep(2, 0, 1): 1,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceCNOT.resource_rep(): 2,
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 1,
-            },
-        ),
-    )
-
-    @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
-        ctrl_data,
-    )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
-        """Test that the controlled resources are as expected"""
-        num_ctrl_wires = len(ctrl_wires)
-        num_ctrl_values = len([v for v in ctrl_values if not v])
-        num_work_wires = len(work_wires)
-
-        op = re.ResourceSWAP([0, 1])
-        op2 = re.ResourceControlled(
-            op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
-        )
-
-        assert (
-            op.controlled_resource_decomp(num_ctrl_wires, num_ctrl_values, num_work_wires)
-            == expected_res
-        )
-        assert op2.resources(**op2.resource_params()) == expected_res
-
-    pow_data = (
-        (1, {re.ResourceSWAP.resource_rep(): 1}),
-        (2, {}),
-        (3, {re.ResourceSWAP.resource_rep(): 1}),
-        (4, {}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
-        """Test that the pow decomposition is correct."""
-        op = re.ResourceSWAP([0, 1])
-        assert op.pow_resource_decomp(z) == expected_res
-
-        op2 = re.ResourcePow(op, z)
-        assert op2.resources(**op2.resource_params()) == expected_res
-
 
 class TestS:
     """Tests for ResourceS"""
@@ -247,16 +487,6 @@ class TestS:
         expected = {re.CompressedResourceOp(re.ResourceT, {}): 2}
         assert op.resources() == expected
 
-    def test_resource_params(self):
-        """Test that the resource params are correct"""
-        op = re.ResourceS(0)
-        assert op.resource_params() == {}
-
-    def test_resource_rep(self):
-        """Test that the compressed representation is correct"""
-        expected = re.CompressedResourceOp(re.ResourceS, {})
-        assert re.ResourceS.resource_rep() == expected
-
     def test_resources_from_rep(self):
         """Test that the resources can be computed from the compressed representation"""
 
@@ -280,85 +510,6 @@ class TestS:
         r2 = re.get_resources(s_dag)
         assert r1 == r2
 
-    pow_data = (
-        (1, {re.ResourceS.resource_rep(): 1}),
-        (2, {re.ResourceS.resource_rep(): 2}),
-        (3, {re.ResourceS.resource_rep(): 3}),
-        (4, {}),
-        (7, {re.ResourceS.resource_rep(): 3}),
-        (8, {}),
-        (14, {re.ResourceS.resource_rep(): 2}),
-        (15, {re.ResourceS.resource_rep(): 3}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
-        """Test that the pow decomposition is correct."""
-        op = re.ResourceS(0)
-        assert op.pow_resource_decomp(z) == expected_res
-
-        op2 = re.ResourcePow(op, z)
-        assert op2.resources(**op2.resource_params()) == expected_res
-
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
-            },
-        ),
-    )
-
-    @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
-        ctrl_data,
-    )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
-        """Test that the controlled resources are as expected"""
-        num_ctrl_wires = len(ctrl_wires)
-        num_ctrl_values = len([v for v in ctrl_values if not v])
-        num_work_wires = len(work_wires)
-
-        op = re.ResourceS(0)
-        op2 = re.ResourceControlled(
-            op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
-        )
-
-        assert (
-            op.controlled_resource_decomp(num_ctrl_wires, num_ctrl_values, num_work_wires)
-            == expected_res
-        )
-        assert op2.resources(**op2.resource_params()) == expected_res
-
 
 class TestT:
     """Tests for ResourceT"""
@@ -369,16 +520,6 @@ class TestT:
         with pytest.raises(re.ResourcesNotDefined):
             op.resources()
 
-    def test_resource_params(self):
-        """Test that the resource params are correct"""
-        op = re.ResourceT(0)
-        assert op.resource_params() == {}
-
-    def test_resource_rep(self):
-        """Test that the compact representation is correct"""
-        expected = re.CompressedResourceOp(re.ResourceT, {})
-        assert re.ResourceT.resource_rep() == expected
-
     def test_adjoint_decomposition(self):
         """Test that the adjoint resources are correct."""
         expected = {re.ResourceT.resource_rep(): 7}
@@ -391,85 +532,6 @@ class TestT:
         r2 = re.get_resources(t_dag)
         assert r1 == r2
 
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceControlledPhaseShift.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
-            },
-        ),
-    )
-
-    @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
-        ctrl_data,
-    )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
-        """Test that the controlled resources are as expected"""
-        num_ctrl_wires = len(ctrl_wires)
-        num_ctrl_values = len([v for v in ctrl_values if not v])
-        num_work_wires = len(work_wires)
-
-        op = re.ResourceT(0)
-        op2 = re.ResourceControlled(
-            op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
-        )
-
-        assert (
-            op.controlled_resource_decomp(num_ctrl_wires, num_ctrl_values, num_work_wires)
-            == expected_res
-        )
-        assert op2.resources(**op2.resource_params()) == expected_res
-
-    pow_data = (
-        (1, {re.ResourceT.resource_rep(): 1}),
-        (2, {re.ResourceT.resource_rep(): 2}),
-        (3, {re.ResourceT.resource_rep(): 3}),
-        (7, {re.ResourceT.resource_rep(): 7}),
-        (8, {}),
-        (14, {re.ResourceT.resource_rep(): 6}),
-        (15, {re.ResourceT.resource_rep(): 7}),
-        (16, {}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
-        """Test that the pow decomposition is correct."""
-        op = re.ResourceT(0)
-        assert op.pow_resource_decomp(z) == expected_res
-
-        op2 = re.ResourcePow(op, z)
-        assert op2.resources(**op2.resource_params()) == expected_res
-
 
 class TestX:
     """Tests for the ResourceX gate"""
@@ -482,90 +544,6 @@ class TestX:
         }
         assert re.ResourceX.resources() == expected
 
-    def test_resource_params(self):
-        """Test that the resource params are correct"""
-        op = re.ResourceX(0)
-        assert op.resource_params() == {}
-
-    def test_resource_rep(self):
-        """Test that the compact representation is correct"""
-        expected = re.CompressedResourceOp(re.ResourceX, {})
-        assert re.ResourceX.resource_rep() == expected
-
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceCNOT.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceCNOT.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceToffoli.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [0, 0],
-            ["w1"],
-            {
-                re.ResourceToffoli.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 4,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 1,
-            },
-        ),
-        (
-            ["c1", "c2", "c3", "c4"],
-            [1, 0, 0, 1],
-            ["w1", "w2"],
-            {
-                re.ResourceMultiControlledX.resource_rep(4, 2, 2): 1,
-            },
-        ),
-    )
-
-    @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
-        ctrl_data,
-    )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
-        """Test that the controlled resources are as expected"""
-        num_ctrl_wires = len(ctrl_wires)
-        num_ctrl_values = len([v for v in ctrl_values if not v])
-        num_work_wires = len(work_wires)
-
-        op = re.ResourceX(0)
-        op2 = re.ResourceControlled(
-            op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
-        )
-
-        assert (
-            op.controlled_resource_decomp(num_ctrl_wires, num_ctrl_values, num_work_wires)
-            == expected_res
-        )
-        assert op2.resources(**op2.resource_params()) == expected_res
-
     def test_adjoint_decomposition(self):
         """Test that the adjoint resources are correct."""
         expected = {re.ResourceX.resource_rep(): 1}
@@ -578,22 +556,6 @@ class TestX:
         r2 = re.get_resources(x_dag)
         assert r1 == r2
 
-    pow_data = (
-        (1, {re.ResourceX.resource_rep(): 1}),
-        (2, {}),
-        (3, {re.ResourceX.resource_rep(): 1}),
-        (4, {}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
-        """Test that the pow decomposition is correct."""
-        op = re.ResourceX(0)
-        assert op.pow_resource_decomp(z) == expected_res
-
-        op2 = re.ResourcePow(op, z)
-        assert op2.resources(**op2.resource_params()) == expected_res
-
 
 class TestY:
     """Tests for the ResourceY gate"""
@@ -606,84 +568,6 @@ class TestY:
         }
         assert re.ResourceY.resources() == expected
 
-    def test_resource_params(self):
-        """Test that the resource params are correct"""
-        op = re.ResourceY(0)
-        assert op.resource_params() == {}
-
-    def test_resource_rep(self):
-        """Test that the compact representation is correct"""
-        expected = re.CompressedResourceOp(re.ResourceY, {})
-        assert re.ResourceY.resource_rep() == expected
-
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceCY.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceCY.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceCY.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(2, 0, 1): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [0, 0],
-            ["w1"],
-            {
-                re.ResourceCY.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(2, 2, 1): 2,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceCY.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
-            },
-        ),
-    )
-
-    @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
-        ctrl_data,
-    )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
-        """Test that the controlled resources are as expected"""
-        num_ctrl_wires = len(ctrl_wires)
-        num_ctrl_values = len([v for v in ctrl_values if not v])
-        num_work_wires = len(work_wires)
-
-        op = re.ResourceY(0)
-        op2 = re.ResourceControlled(
-            op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
-        )
-
-        assert (
-            op.controlled_resource_decomp(num_ctrl_wires, num_ctrl_values, num_work_wires)
-            == expected_res
-        )
-        assert op2.resources(**op2.resource_params()) == expected_res
-
     def test_adjoint_decomposition(self):
         """Test that the adjoint resources are correct."""
         expected = {re.ResourceY.resource_rep(): 1}
@@ -696,22 +580,6 @@ class TestY:
         r2 = re.get_resources(y_dag)
         assert r1 == r2
 
-    pow_data = (
-        (1, {re.ResourceY.resource_rep(): 1}),
-        (2, {}),
-        (3, {re.ResourceY.resource_rep(): 1}),
-        (4, {}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
-        """Test that the pow decomposition is correct."""
-        op = re.ResourceY(0)
-        assert op.pow_resource_decomp(z) == expected_res
-
-        op2 = re.ResourcePow(op, z)
-        assert op2.resources(**op2.resource_params()) == expected_res
-
 
 class TestZ:
     """Tests for the ResourceZ gate"""
@@ -723,83 +591,6 @@ class TestZ:
         }
         assert re.ResourceZ.resources() == expected
 
-    def test_resource_params(self):
-        """Test that the resource params are correct"""
-        op = re.ResourceZ(0)
-        assert op.resource_params() == {}
-
-    def test_resource_rep(self):
-        """Test that the compact representation is correct"""
-        expected = re.CompressedResourceOp(re.ResourceZ, {})
-        assert re.ResourceZ.resource_rep() == expected
-
-    ctrl_data = (
-        (
-            ["c1"],
-            [1],
-            [],
-            {
-                re.ResourceCZ.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1"],
-            [0],
-            [],
-            {
-                re.ResourceCZ.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 2,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [1, 1],
-            ["w1"],
-            {
-                re.ResourceCCZ.resource_rep(): 1,
-            },
-        ),
-        (
-            ["c1", "c2"],
-            [0, 0],
-            ["w1"],
-            {
-                re.ResourceCCZ.resource_rep(): 1,
-                re.ResourceX.resource_rep(): 4,
-            },
-        ),
-        (
-            ["c1", "c2", "c3"],
-            [1, 0, 0],
-            ["w1", "w2"],
-            {
-                re.ResourceCZ.resource_rep(): 1,
-                re.ResourceMultiControlledX.resource_rep(3, 2, 2): 2,
-            },
-        ),
-    )
-
-    @pytest.mark.parametrize(
-        "ctrl_wires, ctrl_values, work_wires, expected_res",
-        ctrl_data,
-    )
-    def test_resource_controlled(self, ctrl_wires, ctrl_values, work_wires, expected_res):
-        """Test that the controlled resources are as expected"""
-        num_ctrl_wires = len(ctrl_wires)
-        num_ctrl_values = len([v for v in ctrl_values if not v])
-        num_work_wires = len(work_wires)
-
-        op = re.ResourceZ(0)
-        op2 = re.ResourceControlled(
-            op, control_wires=ctrl_wires, control_values=ctrl_values, work_wires=work_wires
-        )
-
-        assert (
-            op.controlled_resource_decomp(num_ctrl_wires, num_ctrl_values, num_work_wires)
-            == expected_res
-        )
-        assert op2.resources(**op2.resource_params()) == expected_res
-
     def test_adjoint_decomposition(self):
         """Test that the adjoint resources are correct."""
         expected = {re.ResourceZ.resource_rep(): 1}
@@ -811,19 +602,3 @@ class TestZ:
         r1 = re.get_resources(z)
         r2 = re.get_resources(z_dag)
         assert r1 == r2
-
-    pow_data = (
-        (1, {re.ResourceZ.resource_rep(): 1}),
-        (2, {}),
-        (3, {re.ResourceZ.resource_rep(): 1}),
-        (4, {}),
-    )
-
-    @pytest.mark.parametrize("z, expected_res", pow_data)
-    def test_pow_decomp(self, z, expected_res):
-        """Test that the pow decomposition is correct."""
-        op = re.ResourceZ(0)
-        assert op.pow_resource_decomp(z) == expected_res
-
-        op2 = re.ResourcePow(op, z)
-        assert op2.resources(**op2.resource_params()) == expected_res
@@ -549,3 +549,18 @@ class TestPSWAP:
         op_resource_type = op_compressed_rep.op_type
         op_resource_params = op_compressed_rep.params
         assert op_resource_type.resources(**op_resource_params) == expected
+
+
+@pytest.mark.parametrize(
+    "op_cls",
+    [
+        re.ResourceIsingXX,
+        re.ResourceIsingXY,
+        re.ResourceIsingYY,
+        re.ResourceIsingZZ,
+        re.ResourcePSWAP,
+    ],
+)
+def test_resource_rep_cached(op_cls):
+    """Test that the compact representation of the parameterless multi-qubit operators is only instantiated once"""
+    assert op_cls.resource_rep() is op_cls.resource_rep()
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests for qchem ops resource operators."""
 
+import pytest
+
 import pennylane.labs.resource_estimation as re
 
 # pylint: disable=use-implicit-booleaness-not-comparison,no-self-use
@@ -324,3 +326,21 @@ class TestFermionicSWAP:
         op_resource_type = op_compressed_rep.op_type
         op_resource_params = op_compressed_rep.params
         assert op_resource_type.resources(**op_resource_params) == expected
+
+
+@pytest.mark.parametrize(
+    "op_cls",
+    [
+        re.ResourceSingleExcitation,
+        re.ResourceSingleExcitationMinus,
+        re.ResourceSingleExcitationPlus,
+        re.ResourceDoubleExcitation,
+        re.ResourceDoubleExcitationMinus,
+        re.ResourceDoubleExcitationPlus,
+        re.ResourceOrbitalRotation,
+        re.ResourceFermionicSWAP,
+    ],
+)
+def test_resource_rep_cached(op_cls):
+    """Test that the compact representation of the qchem operators is only instantiated once"""
+    assert op_cls.resource_rep() is op_cls.resource_rep()
@@ -189,3 +189,12 @@ class TestGlobalPhase:
 
         op2 = re.ResourcePow(op, z)
         assert op2.resources(**op2.resource_params()) == expected_res
+
+
+@pytest.mark.parametrize(
+    "op_cls",
+    [re.ResourceIdentity, re.ResourceGlobalPhase],
+)
+def test_resource_rep_cached(op_cls):
+    """Test that the compact representation of the identity operators is only instantiated once"""
+    assert op_cls.resource_rep() is op_cls.resource_rep()
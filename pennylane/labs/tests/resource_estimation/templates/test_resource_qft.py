@@ -43,6 +43,15 @@ class TestQFT:
 
         assert re.ResourceQFT.resources(num_wires) == expected
 
+    def test_resources_are_independent_dicts(self):
+        """Test that each call returns a new dictionary, so modifying one does not affect the
+        resources returned later"""
+        res = re.ResourceQFT.resources(3)
+        assert isinstance(res, dict)
+
+        res[re.ResourceHadamard.resource_rep()] = 0
+        assert re.ResourceQFT.resources(3)[re.ResourceHadamard.resource_rep()] == 3
+
     @pytest.mark.parametrize("wires", [range(1), range(2), range(3), range(4)])
     def test_resource_params(self, wires):
         """Test that the resource params are correct"""
@@ -55,6 +64,7 @@ class TestQFT:
 
         expected = re.CompressedResourceOp(re.ResourceQFT, {"num_wires": num_wires})
         assert re.ResourceQFT.resource_rep(num_wires) == expected
+        assert re.ResourceQFT.resource_rep(num_wires) is re.ResourceQFT.resource_rep(num_wires)
 
     @pytest.mark.parametrize(
         "num_wires, num_hadamard, num_swap, num_ctrl_phase_shift",
@@ -21,62 +21,22 @@ import pennylane.labs.resource_estimation as re
 # pylint: disable=abstract-class-instantiated,arguments-differ,missing-function-docstring,too-few-public-methods
 
 
-def test_abstract_resource_decomp():
-    """Test that the _resource_decomp method is abstract."""
-
-    class DummyClass(re.ResourceOperator):
-        """Dummy class for testing"""
-
-        def resource_params(self):
-            return
-
-        @staticmethod
-        def resource_rep():
-            return
-
-    with pytest.raises(
-        TypeError,
-        match="Can't instantiate abstract class DummyClass with abstract method _resource_decomp",
-    ):
-        DummyClass()
+abstract_methods = ("_resource_decomp", "resource_params", "resource_rep")
 
 
-def test_abstract_resource_params():
-    """Test that the resource_params method is abstract"""
+def _dummy_method(*_, **__):
+    return
 
-    class DummyClass(re.ResourceOperator):
-        """Dummy class for testing"""
 
-        @staticmethod
-        def _resource_decomp():
-            return
-
-        def resource_rep(self):
-            return
-
-    with pytest.raises(
-        TypeError,
-        match="Can't instantiate abstract class DummyClass with abstract method resource_params",
-    ):
-        DummyClass()
-
-
-def test_abstract_resource_rep():
-    """Test that the resource_rep method is abstract"""
-
-    class DummyClass(re.ResourceOperator):
-        """Dummy class for testing"""
-
-        @staticmethod
-        def _resource_decomp():
-            return
-
-        def resource_params(self):
-            return
+@pytest.mark.parametrize("missing", abstract_methods)
+def test_abstract_methods(missing):
+    """Test that the _resource_decomp, resource_params and resource_rep methods are abstract."""
+    methods = {name: _dummy_method for name in abstract_methods if name != missing}
+    DummyClass = type("DummyClass", (re.ResourceOperator,), methods)
 
     with pytest.raises(
         TypeError,
-        match="Can't instantiate abstract class DummyClass with abstract method resource_rep",
+        match=f"Can't instantiate abstract class DummyClass with abstract method {missing}",
     ):
         DummyClass()
 
@@ -598,7 +598,10 @@ class Controlled(SymbolicOp):
     @property
     def _control_int(self):
         """Int. Conversion of ``control_values`` to an integer."""
-        return sum(2**i for i, val in enumerate(reversed(self.control_values)) if val)
+        control_int = 0
+        for val in self.control_values:
+            control_int = (control_int << 1) | bool(val)
+        return control_int
 
     # Properties on the wires ##########################
 
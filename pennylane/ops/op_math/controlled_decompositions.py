@@ -16,6 +16,7 @@ This submodule defines functions to decompose controlled operations
 """
 
 from copy import copy
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -539,9 +540,22 @@ def decompose_mcx(control_wires, target_wire, work_wires):
         return _decompose_mcx_with_one_worker(control_wires, target_wire, work_wires[0])
 
     # Lemma 7.5
+    wire_map = dict(enumerate(control_wires + Wires(target_wire)))
+    return [
+        qml.map_wires(op, wire_map, queue=True)
+        for op in _decompose_mcx_without_work_wires(len(control_wires))
+    ]
+
+
+@lru_cache()
+def _decompose_mcx_without_work_wires(num_control_wires):
+    """Decomposes the multi-controlled PauliX gate on the control wires ``0, ..., n-1`` and the
+    target wire ``n`` without work wires. This decomposition is costly to compute and only depends
+    on the number of control wires, so it is cached and mapped onto the actual wires by the
+    caller."""
     with qml.QueuingManager.stop_recording():
-        op = qml.X(target_wire)
-    return _decompose_multicontrolled_unitary(op, control_wires)
+        op = qml.X(num_control_wires)
+        return tuple(_decompose_multicontrolled_unitary(op, Wires(range(num_control_wires))))
 
 
 def _decompose_multicontrolled_unitary(op, control_wires):
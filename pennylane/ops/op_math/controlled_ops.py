@@ -15,23 +15,167 @@
 This submodule contains controlled operators based on the ControlledOp class.
 """
 # pylint: disable=no-value-for-parameter, arguments-differ, arguments-renamed
+import cmath
+import math
 import warnings
 from collections.abc import Iterable
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import List, Union
 
 import numpy as np
-from scipy.linalg import block_diag
 
 import pennylane as qml
 from pennylane.operation import AnyWires, Wires
+from pennylane.ops.qubit.non_parametric_ops import Hadamard, T
 from pennylane.ops.qubit.parametric_ops_single_qubit import stack_last
 from pennylane.wires import WiresLike
 
 from .controlled import ControlledOp
 from .controlled_decompositions import decompose_mcx
 
-INV_SQRT2 = 1 / qml.math.sqrt(2)
+INV_SQRT2 = 1 / np.sqrt(2)
+
+# Matrices of the non-parametric controlled operators. The arrays are read-only, and
+# ``compute_matrix`` returns copies of them.
+_CH_MATRIX = np.array(
+    [
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, INV_SQRT2, INV_SQRT2],
+        [0, 0, INV_SQRT2, -INV_SQRT2],
+    ]
+)
+_CH_MATRIX.setflags(write=False)
+
+_CY_MATRIX = np.array(
+    [
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 0, -1j],
+        [0, 0, 1j, 0],
+    ]
+)
+_CY_MATRIX.setflags(write=False)
+
+_CZ_MATRIX = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, -1]])
+_CZ_MATRIX.setflags(write=False)
+
+_CSWAP_MATRIX = np.array(
+    [
+        [1, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 0, 0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 0, 0, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 0],
+        [0, 0, 0, 0, 1, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 1],
+    ]
+)
+_CSWAP_MATRIX.setflags(write=False)
+
+_CCZ_MATRIX = np.array(
+    [
+        [1, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 0, 0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 0, 0, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 0],
+        [0, 0, 0, 0, 1, 0, 0, 0],
+        [0, 0, 0, 0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, -1],
+    ]
+)
+_CCZ_MATRIX.setflags(write=False)
+
+_CNOT_MATRIX = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+_CNOT_MATRIX.setflags(write=False)
+
+_TOFFOLI_MATRIX = np.array(
+    [
+        [1, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 0, 0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 0, 0, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 0],
+        [0, 0, 0, 0, 1, 0, 0, 0],
+        [0, 0, 0, 0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 1],
+        [0, 0, 0, 0, 0, 0, 1, 0],
+    ]
+)
+_TOFFOLI_MATRIX.setflags(write=False)
+
+
+# Matrices of the controlled rotations for Python scalar angles, which are often repeated across
+# a circuit. The cached arrays are read-only, and ``compute_matrix`` returns copies of them.
+@lru_cache()
+def _crx_scalar_matrix(theta):
+    c = math.cos(theta / 2)
+    js = -1j * math.sin(theta / 2)
+    mat = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, c, js], [0, 0, js, c]], dtype=complex)
+    mat.setflags(write=False)
+    return mat
+
+
+@lru_cache()
+def _cry_scalar_matrix(theta):
+    c = math.cos(theta / 2)
+    s = math.sin(theta / 2)
+    mat = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, c, -s], [0, 0, s, c]], dtype=complex)
+    mat.setflags(write=False)
+    return mat
+
+
+@lru_cache()
+def _crz_scalar_matrix(theta):
+    p = cmath.exp(-0.5j * theta)
+    mat = np.diag([1, 1, p, p.conjugate()])
+    mat.setflags(write=False)
+    return mat
+
+
+@lru_cache()
+def _crot_scalar_matrix(phi, theta, omega):
+    c = math.cos(theta / 2)
+    s = math.sin(theta / 2)
+    p_plus = cmath.exp(0.5j * (phi + omega))
+    p_minus = cmath.exp(0.5j * (phi - omega))
+    mat = np.array(
+        [
+            [1, 0, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, p_plus.conjugate() * c, -p_minus * s],
+            [0, 0, p_minus.conjugate() * s, p_plus * c],
+        ],
+        dtype=complex,
+    )
+    mat.setflags(write=False)
+    return mat
+
+
+@lru_cache()
+def _cphase_scalar_matrix(phi):
+    mat = np.diag([1, 1, 1, cmath.exp(1j * phi)])
+    mat.setflags(write=False)
+    return mat
+
+
+@lru_cache()
+def _numpy_eye4(dtype):
+    eye = np.eye(4, dtype=dtype)
+    eye.setflags(write=False)
+    return eye
+
+
+def _diags_to_matrices(diags):
+    """Turn broadcasted diagonals of shape ``(batch_size, 4)`` into a stack of diagonal matrices."""
+    if qml.math.get_interface(diags) in ("numpy", "autograd"):
+        # a plain NumPy identity works for both and can be shared between calls
+        eye = _numpy_eye4(diags.dtype)
+    else:
+        # Torch, JAX and TensorFlow identities depend on the device and tracing context
+        eye = qml.math.cast_like(qml.math.eye(4, like=diags), diags)
+    return diags[:, :, np.newaxis] * eye
 
 
 def _deprecate_control_wires(control_wires):
@@ -143,7 +287,7 @@ class ControlledQubitUnitary(ControlledOp):
     ):
         _deprecate_control_wires(control_wires)
         work_wires = Wires(() if work_wires is None else work_wires)
-        if hasattr(base, "wires"):
+        if isinstance(base, qml.operation.Operator):
             warnings.warn(
                 "QubitUnitary input to ControlledQubitUnitary is deprecated and will be removed in v0.42. "
                 "Instead, please use a full matrix as input, or try qml.ctrl for controlled QubitUnitary.",
@@ -177,7 +321,7 @@ class ControlledQubitUnitary(ControlledOp):
         _deprecate_control_wires(control_wires)
         work_wires = Wires(() if work_wires is None else work_wires)
 
-        if hasattr(base, "wires"):
+        if isinstance(base, qml.operation.Operator):
             warnings.warn(
                 "QubitUnitary input to ControlledQubitUnitary is deprecated and will be removed in v0.42. "
                 "Instead, please use a full matrix as input, or try qml.ctrl for controlled QubitUnitary.",
@@ -185,41 +329,22 @@ class ControlledQubitUnitary(ControlledOp):
             )
             base = base.matrix()
 
-        if control_wires == "unset":
-            if not wires:
-                raise TypeError("Must specify a set of wires. None is not a valid `wires` label.")
-            control_wires = wires[:-1]  # default
-
-            if isinstance(base, Iterable):
-                num_base_wires = int(qml.math.log2(qml.math.shape(base)[-1]))
-                target_wires = wires[-num_base_wires:]
-                control_wires = wires[:-num_base_wires]
-                # We use type.__call__ instead of calling the class directly so that we don't bind the
-                # operator primitive when new program capture is enabled
-                base = type.__call__(
-                    qml.QubitUnitary, base, wires=target_wires, unitary_check=unitary_check
-                )
-            else:
-                raise ValueError("Base must be a matrix.")
+        if control_wires != "unset":
+            base, control_wires = self._legacy_base_and_control_wires(
+                base, control_wires, wires, unitary_check
+            )
+        elif not wires:
+            raise TypeError("Must specify a set of wires. None is not a valid `wires` label.")
+        elif isinstance(base, Iterable):
+            num_base_wires = qml.math.shape(base)[-1].bit_length() - 1
+            control_wires = wires[:-num_base_wires]
+            # We use type.__call__ instead of calling the class directly so that we don't bind the
+            # operator primitive when new program capture is enabled
+            base = type.__call__(
+                qml.QubitUnitary, base, wires=wires[-num_base_wires:], unitary_check=unitary_check
+            )
         else:
-            # Below is the legacy interface, where control_wires provided
-            wires = Wires(() if wires is None else wires)
-            control_wires = Wires(control_wires)
-            if isinstance(base, Iterable):
-                if len(wires) == 0:
-                    if len(control_wires) > 1:
-                        num_base_wires = int(qml.math.log2(qml.math.shape(base)[-1]))
-                        wires = control_wires[-num_base_wires:]
-                        control_wires = control_wires[:-num_base_wires]
-                    else:
-                        raise TypeError(
-                            "Must specify a set of wires. None is not a valid `wires` label."
-                        )
-                # We use type.__call__ instead of calling the class directly so that we don't bind the
-                # operator primitive when new program capture is enabled
-                base = type.__call__(
-                    qml.QubitUnitary, base, wires=wires, unitary_check=unitary_check
-                )
+            raise ValueError("Base must be a matrix.")
 
         super().__init__(
             base,
@@ -229,12 +354,35 @@ class ControlledQubitUnitary(ControlledOp):
         )
         self._name = "ControlledQubitUnitary"
 
+    @staticmethod
+    def _legacy_base_and_control_wires(base, control_wires, wires, unitary_check):
+        """Process the deprecated ``control_wires`` interface into a base operator and
+        control wires."""
+        wires = Wires(() if wires is None else wires)
+        control_wires = Wires(control_wires)
+        if isinstance(base, Iterable):
+            if len(wires) == 0:
+                if len(control_wires) > 1:
+                    num_base_wires = qml.math.shape(base)[-1].bit_length() - 1
+                    wires = control_wires[-num_base_wires:]
+                    control_wires = control_wires[:-num_base_wires]
+                else:
+                    raise TypeError(
+                        "Must specify a set of wires. None is not a valid `wires` label."
+                    )
+            # We use type.__call__ instead of calling the class directly so that we don't bind the
+            # operator primitive when new program capture is enabled
+            base = type.__call__(qml.QubitUnitary, base, wires=wires, unitary_check=unitary_check)
+
+        return base, control_wires
+
     def _controlled(self, wire):
         ctrl_wires = wire + self.control_wires
         values = None if self.control_values is None else [True] + self.control_values
         base = self.base
         if isinstance(self.base, qml.QubitUnitary):
-            base = self.base.matrix()
+            # reuse the stored unitary directly rather than recomputing it via ``matrix``
+            base = self.base.data[0]
 
         return ControlledQubitUnitary(
             base,
@@ -247,14 +395,13 @@ class ControlledQubitUnitary(ControlledOp):
     def has_decomposition(self):
         if not super().has_decomposition:
             return False
-        with qml.QueuingManager.stop_recording():
-            # we know this is using try-except as logical control, but are favouring
-            # certainty in it being correct over explicitness in an edge case.
-            try:
-                self.decomposition()
-            except qml.operation.DecompositionUndefinedError:
-                return False
-        return True
+        num_base_wires = len(self.base.wires)
+        if num_base_wires > 2:
+            # QubitUnitary is not decomposed on more than two wires, so the only
+            # decomposition is flipping the control wires that control on zero
+            return not all(self.control_values)
+        # the two-qubit decomposition of QubitUnitary does not support broadcasting
+        return num_base_wires == 1 or self.base.batch_size is None
 
 
 class CH(ControlledOp):
@@ -314,7 +461,6 @@ class CH(ControlledOp):
         return f"CH(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -335,14 +481,7 @@ class CH(ControlledOp):
          [ 0.          0.          0.70710678  0.70710678]
          [ 0.          0.          0.70710678 -0.70710678]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0],
-                [0, 1, 0, 0],
-                [0, 0, INV_SQRT2, INV_SQRT2],
-                [0, 0, INV_SQRT2, -INV_SQRT2],
-            ]
-        )
+        return _CH_MATRIX.copy()
 
     @staticmethod
     def compute_decomposition(wires):  # pylint: disable=arguments-differ
@@ -429,7 +568,6 @@ class CY(ControlledOp):
         return f"CY(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -450,14 +588,7 @@ class CY(ControlledOp):
          [ 0.+0.j  0.+0.j  0.+0.j -0.-1.j]
          [ 0.+0.j  0.+0.j  0.+1.j  0.+0.j]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0],
-                [0, 1, 0, 0],
-                [0, 0, 0, -1j],
-                [0, 0, 1j, 0],
-            ]
-        )
+        return _CY_MATRIX.copy()
 
     @staticmethod
     def compute_decomposition(wires):  # pylint: disable=arguments-differ
@@ -538,7 +669,6 @@ class CZ(ControlledOp):
         return f"CZ(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -558,7 +688,7 @@ class CZ(ControlledOp):
          [ 0  0  1  0]
          [ 0  0  0 -1]]
         """
-        return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, -1]])
+        return _CZ_MATRIX.copy()
 
     def _controlled(self, wire):
         return qml.CCZ(wires=wire + self.wires)
@@ -629,7 +759,6 @@ class CSWAP(ControlledOp):
         return f"CSWAP(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -653,18 +782,7 @@ class CSWAP(ControlledOp):
          [0 0 0 0 0 1 0 0]
          [0 0 0 0 0 0 0 1]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1],
-            ]
-        )
+        return _CSWAP_MATRIX.copy()
 
     @staticmethod
     def compute_decomposition(wires):  # pylint: disable=arguments-differ
@@ -687,12 +805,7 @@ class CSWAP(ControlledOp):
         [Toffoli(wires=[0, 2, 1]), Toffoli(wires=[0, 1, 2]), Toffoli(wires=[0, 2, 1])]
 
         """
-        decomp_ops = [
-            qml.Toffoli(wires=[wires[0], wires[2], wires[1]]),
-            qml.Toffoli(wires=[wires[0], wires[1], wires[2]]),
-            qml.Toffoli(wires=[wires[0], wires[2], wires[1]]),
-        ]
-        return decomp_ops
+        return [Toffoli(wires=[wires[i] for i in idx]) for idx in _CSWAP_DECOMPOSITION_TEMPLATE]
 
 
 class CCZ(ControlledOp):
@@ -757,7 +870,6 @@ class CCZ(ControlledOp):
         return f"CCZ(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -782,18 +894,7 @@ class CCZ(ControlledOp):
          [0 0 0 0 0 0 1 0]
          [0 0 0 0 0 0 0 -1]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 0, 0, 0, -1],
-            ]
-        )
+        return _CCZ_MATRIX.copy()
 
     @staticmethod
     def compute_decomposition(wires):  # pylint: disable=arguments-differ
@@ -823,30 +924,12 @@ class CCZ(ControlledOp):
          T(2),
          T(1),
          CNOT(wires=[0, 1]),
-         H(2),
          T(0),
          Adjoint(T(1)),
-         CNOT(wires=[0, 1]),
-         H(2)]
+         CNOT(wires=[0, 1])]
 
         """
-        return [
-            qml.CNOT(wires=[wires[1], wires[2]]),
-            qml.adjoint(qml.T(wires=wires[2])),
-            qml.CNOT(wires=[wires[0], wires[2]]),
-            qml.T(wires=wires[2]),
-            qml.CNOT(wires=[wires[1], wires[2]]),
-            qml.adjoint(qml.T(wires=wires[2])),
-            qml.CNOT(wires=[wires[0], wires[2]]),
-            qml.T(wires=wires[2]),
-            qml.T(wires=wires[1]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.Hadamard(wires=wires[2]),
-            qml.T(wires=wires[0]),
-            qml.adjoint(qml.T(wires=wires[1])),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.Hadamard(wires=wires[2]),
-        ]
+        return [op(wires=[wires[i] for i in idx]) for op, idx in _CCZ_DECOMPOSITION_TEMPLATE]
 
 
 class CNOT(ControlledOp):
@@ -929,7 +1012,6 @@ class CNOT(ControlledOp):
         return f"CNOT(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -950,7 +1032,7 @@ class CNOT(ControlledOp):
          [0 0 0 1]
          [0 0 1 0]]
         """
-        return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+        return _CNOT_MATRIX.copy()
 
     def _controlled(self, wire):
         return qml.Toffoli(wires=wire + self.wires)
@@ -1017,7 +1099,6 @@ class Toffoli(ControlledOp):
         return f"Toffoli(wires={self.wires.tolist()})"
 
     @staticmethod
-    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -1042,18 +1123,7 @@ class Toffoli(ControlledOp):
          [0 0 0 0 0 0 0 1]
          [0 0 0 0 0 0 1 0]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-            ]
-        )
+        return _TOFFOLI_MATRIX.copy()
 
     @staticmethod
     def compute_decomposition(wires):  # pylint: disable=arguments-differ
@@ -1090,29 +1160,13 @@ class Toffoli(ControlledOp):
          CNOT(wires=[0, 1])]
 
         """
-        return [
-            qml.Hadamard(wires=wires[2]),
-            CNOT(wires=[wires[1], wires[2]]),
-            qml.adjoint(qml.T(wires=wires[2])),
-            CNOT(wires=[wires[0], wires[2]]),
-            qml.T(wires=wires[2]),
-            CNOT(wires=[wires[1], wires[2]]),
-            qml.adjoint(qml.T(wires=wires[2])),
-            CNOT(wires=[wires[0], wires[2]]),
-            qml.T(wires=wires[2]),
-            qml.T(wires=wires[1]),
-            CNOT(wires=[wires[0], wires[1]]),
-            qml.Hadamard(wires=wires[2]),
-            qml.T(wires=wires[0]),
-            qml.adjoint(qml.T(wires=wires[1])),
-            CNOT(wires=[wires[0], wires[1]]),
-        ]
+        return [op(wires=[wires[i] for i in idx]) for op, idx in _TOFFOLI_DECOMPOSITION_TEMPLATE]
 
 
 def _check_and_convert_control_values(control_values, control_wires):
     if isinstance(control_values, str):
         # Make sure all values are either 0 or 1
-        if not set(control_values).issubset({"1", "0"}):
+        if control_values.strip("01"):
             raise ValueError("String of control values can contain only '0' or '1'.")
 
         control_values = [int(x) for x in control_values]
@@ -1251,7 +1305,7 @@ class MultiControlledX(ControlledOp):
             f"MultiControlledX(wires={self.wires.tolist()}, control_values={self.control_values})"
         )
 
-    @property
+    @cached_property
     def wires(self):
         return self.control_wires + self.target_wires
 
@@ -1288,10 +1342,21 @@ class MultiControlledX(ControlledOp):
 
         """
 
-        control_values = _check_and_convert_control_values(control_values, control_wires)
-        padding_left = sum(2**i * int(val) for i, val in enumerate(reversed(control_values))) * 2
-        padding_right = 2 ** (len(control_wires) + 1) - 2 - padding_left
-        return block_diag(np.eye(padding_left), qml.X.compute_matrix(), np.eye(padding_right))
+        dim = 1 << (len(control_wires) + 1)
+        if control_values is None:
+            # all controls are active on 1, so the X block is the last one
+            padding_left = dim - 2
+        else:
+            control_values = _check_and_convert_control_values(control_values, control_wires)
+            control_int = 0
+            for val in control_values:
+                control_int = (control_int << 1) | bool(val)
+            padding_left = control_int << 1
+        # the matrix is the identity, except that the X block swaps the two target
+        # basis states belonging to the active control state
+        mat = np.eye(dim)
+        mat[[padding_left, padding_left + 1]] = mat[[padding_left + 1, padding_left]]
+        return mat
 
     def matrix(self, wire_order=None):
         canonical_matrix = self.compute_matrix(self.control_wires, self.control_values)
@@ -1342,11 +1407,14 @@ class MultiControlledX(ControlledOp):
 
         work_wires = work_wires or []
 
-        flips1 = [qml.X(w) for w, val in zip(control_wires, control_values) if not val]
+        flip_wires = [w for w, val in zip(control_wires, control_values) if not val]
+
+        # the flips before and after are distinct operators so that both get queued
+        flips1 = [qml.X(w) for w in flip_wires]
 
         decomp = decompose_mcx(control_wires, target_wire, work_wires)
 
-        flips2 = [qml.X(w) for w, val in zip(control_wires, control_values) if not val]
+        flips2 = [qml.X(w) for w in flip_wires]
 
         return flips1 + decomp + flips2
 
@@ -1448,18 +1516,30 @@ class CRX(ControlledOp):
                 [0.0+0.0j, 0.0+0.0j, 0.9689+0.0j, 0.0-0.2474j],
                 [0.0+0.0j, 0.0+0.0j, 0.0-0.2474j, 0.9689+0.0j]])
         """
+        if isinstance(theta, (int, float)):
+            return _crx_scalar_matrix(theta).copy()
 
         interface = qml.math.get_interface(theta)
 
+        if interface == "numpy":
+            # fill the (possibly broadcasted) matrix directly instead of stacking its entries
+            c = np.cos(theta / 2)
+            js = -1j * np.sin(theta / 2)
+            mat = np.zeros(np.shape(theta) + (4, 4), dtype=np.result_type(c.dtype, np.complex64))
+            mat[..., 0, 0] = mat[..., 1, 1] = 1
+            mat[..., 2, 2] = mat[..., 3, 3] = c
+            mat[..., 2, 3] = mat[..., 3, 2] = js
+            return mat
+
         c = qml.math.cos(theta / 2)
         s = qml.math.sin(theta / 2)
 
         if interface == "tensorflow":
             c = qml.math.cast_like(c, 1j)
             s = qml.math.cast_like(s, 1j)
-
-        # The following avoids casting an imaginary quantity to reals when back propagating
-        c = (1 + 0j) * c
+        else:
+            # The following avoids casting an imaginary quantity to reals when back propagating
+            c = (1 + 0j) * c
         js = -1j * s
         ones = qml.math.ones_like(js)
         zeros = qml.math.zeros_like(js)
@@ -1499,7 +1579,11 @@ class CRX(ControlledOp):
         RZ(-1.5707963267948966, wires=[1])]
 
         """
-        pi_half = qml.math.ones_like(phi) * (np.pi / 2)
+        if isinstance(phi, (int, float)):
+            pi_half = np.pi / 2
+        else:
+            # match the interface and broadcasting of phi
+            pi_half = qml.math.ones_like(phi) * (np.pi / 2)
         return [
             qml.RZ(pi_half, wires=wires[1]),
             qml.RY(phi / 2, wires=wires[1]),
@@ -1605,18 +1689,32 @@ class CRY(ControlledOp):
                 [ 0.0000+0.j,  0.0000+0.j,  0.9689+0.j, -0.2474-0.j],
                 [ 0.0000+0.j,  0.0000+0.j,  0.2474+0.j,  0.9689+0.j]])
         """
+        if isinstance(theta, (int, float)):
+            return _cry_scalar_matrix(theta).copy()
+
         interface = qml.math.get_interface(theta)
 
+        if interface == "numpy":
+            # fill the (possibly broadcasted) matrix directly instead of stacking its entries
+            c = np.cos(theta / 2)
+            s = np.sin(theta / 2)
+            mat = np.zeros(np.shape(theta) + (4, 4), dtype=np.result_type(c.dtype, np.complex64))
+            mat[..., 0, 0] = mat[..., 1, 1] = 1
+            mat[..., 2, 2] = mat[..., 3, 3] = c
+            mat[..., 2, 3] = -s
+            mat[..., 3, 2] = s
+            return mat
+
         c = qml.math.cos(theta / 2)
         s = qml.math.sin(theta / 2)
 
         if interface == "tensorflow":
             c = qml.math.cast_like(c, 1j)
             s = qml.math.cast_like(s, 1j)
-
-        # The following avoids casting an imaginary quantity to reals when back propagating
-        c = (1 + 0j) * c
-        s = (1 + 0j) * s
+        else:
+            # The following avoids casting an imaginary quantity to reals when back propagating
+            c = (1 + 0j) * c
+            s = (1 + 0j) * s
         ones = qml.math.ones_like(s)
         zeros = qml.math.zeros_like(s)
         matrix = [
@@ -1760,14 +1858,28 @@ class CRZ(ControlledOp):
                 [0.0+0.0j, 0.0+0.0j, 0.9689-0.2474j,       0.0+0.0j],
                 [0.0+0.0j, 0.0+0.0j,       0.0+0.0j, 0.9689+0.2474j]])
         """
-        if qml.math.get_interface(theta) == "tensorflow":
+        if isinstance(theta, (int, float)):
+            return _crz_scalar_matrix(theta).copy()
+
+        interface = qml.math.get_interface(theta)
+
+        if interface == "numpy":
+            # fill the (possibly broadcasted) diagonal directly
+            p = np.exp(-0.5j * np.asarray(theta, dtype=complex))
+            mat = np.zeros(np.shape(theta) + (4, 4), dtype=complex)
+            mat[..., 0, 0] = mat[..., 1, 1] = 1
+            mat[..., 2, 2] = p
+            mat[..., 3, 3] = np.conj(p)
+            return mat
+
+        if interface == "tensorflow":
             p = qml.math.exp(-0.5j * qml.math.cast_like(theta, 1j))
             if qml.math.ndim(p) == 0:
                 return qml.math.diag([1, 1, p, qml.math.conj(p)])
 
             ones = qml.math.ones_like(p)
             diags = stack_last([ones, ones, p, qml.math.conj(p)])
-            return diags[:, :, np.newaxis] * qml.math.cast_like(qml.math.eye(4, like=diags), diags)
+            return _diags_to_matrices(diags)
 
         signs = qml.math.array([0, 0, 1, -1], like=theta)
         arg = -0.5j * theta
@@ -1776,7 +1888,7 @@ class CRZ(ControlledOp):
             return qml.math.diag(qml.math.exp(arg * signs))
 
         diags = qml.math.exp(qml.math.outer(arg, signs))
-        return diags[:, :, np.newaxis] * qml.math.cast_like(qml.math.eye(4, like=diags), diags)
+        return _diags_to_matrices(diags)
 
     @staticmethod
     def compute_eigvals(theta, **_):  # pylint: disable=arguments-differ
@@ -1805,7 +1917,22 @@ class CRZ(ControlledOp):
         >>> qml.CRZ.compute_eigvals(torch.tensor(0.5))
         tensor([1.0000+0.0000j, 1.0000+0.0000j, 0.9689-0.2474j, 0.9689+0.2474j])
         """
-        if qml.math.get_interface(theta) == "tensorflow":
+        if isinstance(theta, (int, float, np.integer, np.floating)):
+            p = cmath.exp(-0.5j * float(theta))
+            return np.array([1, 1, p, p.conjugate()])
+
+        interface = qml.math.get_interface(theta)
+
+        if interface == "numpy":
+            # only the last two eigenvalues depend on theta, and they are conjugates
+            p = np.exp(-0.5j * np.asarray(theta, dtype=complex))
+            eigvals = np.empty(np.shape(theta) + (4,), dtype=complex)
+            eigvals[..., 0] = eigvals[..., 1] = 1
+            eigvals[..., 2] = p
+            eigvals[..., 3] = np.conj(p)
+            return eigvals
+
+        if interface == "tensorflow":
             phase = qml.math.exp(-0.5j * qml.math.cast_like(theta, 1j))
             ones = qml.math.ones_like(phase)
             return stack_last([ones, ones, phase, qml.math.conj(phase)])
@@ -1957,11 +2084,31 @@ class CRot(ControlledOp):
                 [ 0.0+0.0j,  0.0+0.0j,  0.9752-0.1977j, -0.0993+0.0100j],
                 [ 0.0+0.0j,  0.0+0.0j,  0.0993+0.0100j,  0.9752+0.1977j]])
         """
+        if all(isinstance(p, (int, float)) for p in (phi, theta, omega)):
+            return _crot_scalar_matrix(phi, theta, omega).copy()
+
         # It might be that they are in different interfaces, e.g.,
         # CRot(0.2, 0.3, tf.Variable(0.5), wires=[0, 1])
         # So we need to make sure the matrix comes out having the right type
         interface = qml.math.get_interface(phi, theta, omega)
 
+        if interface == "numpy":
+            # fill the (possibly broadcasted) lower-right block directly, using that
+            # exp(-ix) is the conjugate of exp(ix) for real x
+            c = np.cos(theta / 2)
+            s = np.sin(theta / 2)
+            # promote cos and sin with the other angles; their shapes broadcast in the products
+            dtype = np.result_type(np.asarray(phi), np.asarray(omega), c)
+            c, s = c.astype(dtype), s.astype(dtype)
+            p_plus = np.exp(-0.5j * (phi + omega))
+            p_minus = np.exp(0.5j * (phi - omega))
+            block = (p_plus * c, -p_minus * s, np.conj(p_minus) * s, np.conj(p_plus) * c)
+
+            mat = np.zeros(np.shape(block[0]) + (4, 4), dtype=block[0].dtype)
+            mat[..., 0, 0] = mat[..., 1, 1] = 1
+            mat[..., 2, 2], mat[..., 2, 3], mat[..., 3, 2], mat[..., 3, 3] = block
+            return mat
+
         c = qml.math.cos(theta / 2)
         s = qml.math.sin(theta / 2)
 
@@ -2121,14 +2268,26 @@ class ControlledPhaseShift(ControlledOp):
                     [0.0+0.0j, 0.0+0.0j, 1.0+0.0j, 0.0000+0.0000j],
                     [0.0+0.0j, 0.0+0.0j, 0.0+0.0j, 0.8776+0.4794j]])
         """
-        if qml.math.get_interface(phi) == "tensorflow":
+        if isinstance(phi, (int, float)):
+            return _cphase_scalar_matrix(phi).copy()
+
+        interface = qml.math.get_interface(phi)
+
+        if interface == "numpy":
+            # fill the (possibly broadcasted) diagonal directly
+            mat = np.zeros(np.shape(phi) + (4, 4), dtype=complex)
+            mat[..., 0, 0] = mat[..., 1, 1] = mat[..., 2, 2] = 1
+            mat[..., 3, 3] = np.exp(1j * np.asarray(phi, dtype=complex))
+            return mat
+
+        if interface == "tensorflow":
             p = qml.math.exp(1j * qml.math.cast_like(phi, 1j))
             if qml.math.ndim(p) == 0:
                 return qml.math.diag([1, 1, 1, p])
 
             ones = qml.math.ones_like(p)
             diags = stack_last([ones, ones, ones, p])
-            return diags[:, :, np.newaxis] * qml.math.cast_like(qml.math.eye(4, like=diags), diags)
+            return _diags_to_matrices(diags)
 
         signs = qml.math.array([0, 0, 0, 1], like=phi)
         arg = 1j * phi
@@ -2137,7 +2296,7 @@ class ControlledPhaseShift(ControlledOp):
             return qml.math.diag(qml.math.exp(arg * signs))
 
         diags = qml.math.exp(qml.math.outer(arg, signs))
-        return diags[:, :, np.newaxis] * qml.math.cast_like(qml.math.eye(4, like=diags), diags)
+        return _diags_to_matrices(diags)
 
     @staticmethod
     def compute_eigvals(phi, **_):  # pylint: disable=arguments-differ
@@ -2166,7 +2325,18 @@ class ControlledPhaseShift(ControlledOp):
         >>> qml.ControlledPhaseShift.compute_eigvals(torch.tensor(0.5))
         tensor([1.0000+0.0000j, 1.0000+0.0000j, 1.0000+0.0000j, 0.8776+0.4794j])
         """
-        if qml.math.get_interface(phi) == "tensorflow":
+        if isinstance(phi, (int, float, np.integer, np.floating)):
+            return np.array([1, 1, 1, cmath.exp(1j * float(phi))])
+
+        interface = qml.math.get_interface(phi)
+
+        if interface == "numpy":
+            # only the last eigenvalue depends on phi
+            eigvals = np.ones(np.shape(phi) + (4,), dtype=complex)
+            eigvals[..., 3] = np.exp(1j * np.asarray(phi, dtype=complex))
+            return eigvals
+
+        if interface == "tensorflow":
             phase = qml.math.exp(1j * qml.math.cast_like(phi, 1j))
             ones = qml.math.ones_like(phase)
             return stack_last([ones, ones, ones, phase])
@@ -2216,3 +2386,46 @@ class ControlledPhaseShift(ControlledOp):
 
 
 CPhase = ControlledPhaseShift
+
+
+def _adjoint_t(wires):
+    return qml.adjoint(T(wires=wires))
+
+
+# Fixed gate sequences of the CCZ, Toffoli and CSWAP decompositions, given as the operator
+# constructor (where not implied) and the indices of the wires it acts on.
+_CCZ_DECOMPOSITION_TEMPLATE = (
+    (CNOT, (1, 2)),
+    (_adjoint_t, (2,)),
+    (CNOT, (0, 2)),
+    (T, (2,)),
+    (CNOT, (1, 2)),
+    (_adjoint_t, (2,)),
+    (CNOT, (0, 2)),
+    (T, (2,)),
+    (T, (1,)),
+    (CNOT, (0, 1)),
+    (T, (0,)),
+    (_adjoint_t, (1,)),
+    (CNOT, (0, 1)),
+)
+
+_TOFFOLI_DECOMPOSITION_TEMPLATE = (
+    (Hadamard, (2,)),
+    (CNOT, (1, 2)),
+    (_adjoint_t, (2,)),
+    (CNOT, (0, 2)),
+    (T, (2,)),
+    (CNOT, (1, 2)),
+    (_adjoint_t, (2,)),
+    (CNOT, (0, 2)),
+    (T, (2,)),
+    (T, (1,)),
+    (CNOT, (0, 1)),
+    (Hadamard, (2,)),
+    (T, (0,)),
+    (_adjoint_t, (1,)),
+    (CNOT, (0, 1)),
+)
+
+_CSWAP_DECOMPOSITION_TEMPLATE = ((0, 2, 1), (0, 1, 2), (0, 2, 1))
@@ -29,7 +29,7 @@ from pennylane.operation import Observable, Operation
 from pennylane.typing import TensorLike
 from pennylane.wires import Wires, WiresLike
 
-INV_SQRT2 = 1 / qml.math.sqrt(2)
+INV_SQRT2 = 1 / np.sqrt(2)
 
 
 class Hadamard(Observable, Operation):
@@ -355,6 +355,60 @@ class TestTwoQubitStateSpecialCases:
         assert qml.math.allclose(initial1[1], new1[0])
         assert qml.math.allclose(initial1[0], new1[1])
 
+    def test_controlled_phase_shift(self, method, wire, ml_framework):
+        """Test the application of a controlled phase shift on a two qubit state."""
+
+        initial_state = np.array(
+            [
+                [0.04624539 + 0.3895457j, 0.22399401 + 0.53870339j],
+                [-0.483054 + 0.2468498j, -0.02772249 - 0.45901669j],
+            ]
+        )
+        initial_state = qml.math.asarray(initial_state, like=ml_framework)
+
+        control = wire
+        target = int(not control)
+
+        phase = qml.math.asarray(-2.3, like=ml_framework)
+        shift = qml.math.exp(1j * qml.math.cast(phase, np.complex128))
+
+        new_state = method(qml.ControlledPhaseShift(phase, (control, target)), initial_state)
+
+        initial0 = qml.math.take(initial_state, 0, axis=control)
+        new0 = qml.math.take(new_state, 0, axis=control)
+        assert qml.math.allclose(initial0, new0)
+
+        initial1 = qml.math.take(initial_state, 1, axis=control)
+        new1 = qml.math.take(new_state, 1, axis=control)
+        assert qml.math.allclose(initial1[0], new1[0])
+        assert qml.math.allclose(shift * initial1[1], new1[1])
+
+    def test_controlled_phase_shift_complex64(self, method, wire, ml_framework):
+        """Test the application of a controlled phase shift on a single precision two qubit
+        state."""
+
+        initial_state = np.array(
+            [
+                [0.04624539 + 0.3895457j, 0.22399401 + 0.53870339j],
+                [-0.483054 + 0.2468498j, -0.02772249 - 0.45901669j],
+            ],
+            dtype=np.complex64,
+        )
+        expected = initial_state.astype(np.complex128)
+        expected[(1, 1)] *= np.exp(-2.3j)
+
+        control = wire
+        target = int(not control)
+        op = qml.ControlledPhaseShift(qml.math.asarray(-2.3, like=ml_framework), (control, target))
+
+        new_state = method(op, qml.math.asarray(initial_state, like=ml_framework))
+
+        assert qml.math.allclose(new_state, expected, atol=1e-6)
+        # pennylane.numpy unwraps the 0-d slices of a two qubit state into Python scalars,
+        # which promotes their product to double precision
+        if method is apply_operation and ml_framework != "autograd":
+            assert qml.math.get_dtype_name(new_state) == "complex64"
+
     def test_grover(self, method, wire, ml_framework):
         """Test the application of GroverOperator on a two qubit state."""
 
@@ -908,6 +962,7 @@ class TestBroadcasting:  # pylint: disable=too-few-public-methods
     broadcasted_ops = [
         qml.RX(np.array([np.pi, np.pi / 2, np.pi / 4]), wires=2),
         qml.PhaseShift(np.array([np.pi, np.pi / 2, np.pi / 4]), wires=2),
+        qml.ControlledPhaseShift(np.array([np.pi, np.pi / 2, np.pi / 4]), wires=[1, 2]),
         qml.IsingXX(np.array([np.pi, np.pi / 2, np.pi / 4]), wires=[1, 2]),
         qml.QubitUnitary(
             np.array([unitary_group.rvs(8), unitary_group.rvs(8), unitary_group.rvs(8)]),
@@ -919,6 +974,7 @@ class TestBroadcasting:  # pylint: disable=too-few-public-methods
         qml.PauliX(2),
         qml.PauliZ(2),
         qml.CNOT([1, 2]),
+        qml.ControlledPhaseShift(np.pi / 2, wires=[1, 2]),
         qml.RX(np.pi, wires=2),
         qml.PhaseShift(np.pi / 2, wires=2),
         qml.IsingXX(np.pi / 2, wires=[1, 2]),
@@ -1360,6 +1416,191 @@ class TestMultiControlledXKernel:
         assert qml.math.allclose(out, exp_out)
 
 
+class TestControlledQubitUnitaryKernel:
+    """Test the specialized kernel for ControlledQubitUnitary and its dispatching."""
+
+    # pylint: disable=too-many-arguments
+    @pytest.mark.parametrize(
+        "num_op_wires, num_state_wires, einsum_called, tdot_called",
+        [
+            # matrix large -> kernel, which uses a single einsum on the target block
+            (9, 9, 1, 0),
+            (9, 11, 1, 0),
+            # matrix tiny, state not huge -> einsum
+            (2, 12, 1, 0),
+            # matrix small, state not huge -> tensordot
+            (5, 12, 0, 1),
+            # matrix small, state huge -> tensordot
+            (5, 13, 0, 1),
+        ],
+    )
+    def test_controlled_qubit_unitary_dispatching(
+        self, num_op_wires, num_state_wires, einsum_called, tdot_called, mocker, seed
+    ):
+        """Test that apply_controlled_qubit_unitary dispatches to the right method and is
+        correct."""
+        op = qml.ControlledQubitUnitary(qml.Hadamard.compute_matrix(), wires=range(num_op_wires))
+        state = np.random.default_rng(seed).random([2] * num_state_wires).astype(complex)
+        spies = [mocker.spy(qml.math, "einsum"), mocker.spy(qml.math, "tensordot")]
+        out = apply_operation(op, state, is_state_batched=False, debugger=None)
+        # Compute expected output
+        exp_out = state.copy()
+        idx = (1,) * (num_op_wires - 1)
+        exp_out[idx] = np.tensordot(qml.Hadamard.compute_matrix(), exp_out[idx], axes=[[1], [0]])
+        assert spies[0].call_count == einsum_called
+        assert spies[1].call_count == tdot_called
+        assert np.allclose(out, exp_out)
+
+    @pytest.mark.parametrize("batch_dim", [None, 1, 3])
+    @pytest.mark.parametrize("num_target_wires", [1, 2])
+    def test_matches_default_method(self, batch_dim, num_target_wires, seed):
+        """Test that the custom kernel agrees with the matrix-based default for
+        permuted wires, mixed control values and batched states."""
+        wires = [3, 9, 0, 5, 1, 7, 2, 8, 6, 4]
+        control_values = [1, 0, 1, 1, 0, 1, 0, 1, 1][: len(wires) - num_target_wires]
+        U = qml.matrix(qml.QFT(wires=range(num_target_wires)))
+        op = qml.ControlledQubitUnitary(U, wires=wires, control_values=control_values)
+        state_shape = ([batch_dim] if batch_dim is not None else []) + [2] * 11
+        rng = np.random.default_rng(seed)
+        state = rng.random(state_shape) + 1j * rng.random(state_shape)
+        is_state_batched = batch_dim is not None
+        out = apply_operation(op, state, is_state_batched=is_state_batched, debugger=None)
+        exp_out = apply_operation_tensordot(op, state, is_state_batched=is_state_batched)
+        assert np.allclose(out, exp_out)
+
+    def test_keeps_single_precision(self, seed):
+        """Test that the custom kernel does not promote a complex64 state."""
+        op = qml.ControlledQubitUnitary(qml.Hadamard.compute_matrix(), wires=range(9))
+        state = np.random.default_rng(seed).random([2] * 10).astype(np.complex64)
+        out = apply_operation(op, state, is_state_batched=False, debugger=None)
+        exp_out = apply_operation_tensordot(op, state.astype(complex))
+        assert out.dtype == np.complex64
+        assert np.allclose(out, exp_out, atol=1e-6)
+
+    @staticmethod
+    def _state_and_expected(batch_dim, seed, x=0.4):
+        """Create a random state on which a 9-wire ControlledQubitUnitary of RY(x) uses the
+        custom kernel, together with the expected output."""
+        state_shape = ([batch_dim] if batch_dim is not None else []) + [2] * 10
+        rng = np.random.default_rng(seed)
+        state = rng.random(state_shape) + 1j * rng.random(state_shape)
+        op = qml.ControlledQubitUnitary(
+            qml.RY.compute_matrix(x), wires=[0, 9, 3, 1, 8, 2, 7, 4, 6], control_values=[1, 0] * 4
+        )
+        exp_out = apply_operation_tensordot(op, state, is_state_batched=batch_dim is not None)
+        return op, state, exp_out
+
+    @pytest.mark.jax
+    @pytest.mark.parametrize("batch_dim", [None, 1, 3])
+    def test_with_jax(self, batch_dim, seed):
+        """Test that the custom kernel works with JAX."""
+        from jax import numpy as jnp
+
+        op, state, exp_out = self._state_and_expected(batch_dim, seed)
+        jax_state = jnp.array(state)
+        out = apply_operation(op, jax_state, is_state_batched=batch_dim is not None, debugger=None)
+        assert qml.math.allclose(out, exp_out)
+
+    @pytest.mark.tf
+    @pytest.mark.parametrize("batch_dim", [None, 1, 3])
+    def test_with_tf(self, batch_dim, seed):
+        """Test that the custom kernel works with Tensorflow."""
+        import tensorflow as tf
+
+        op, state, exp_out = self._state_and_expected(batch_dim, seed)
+        tf_state = tf.Variable(state)
+        out = apply_operation(op, tf_state, is_state_batched=batch_dim is not None, debugger=None)
+        assert qml.math.allclose(out, exp_out)
+
+    @pytest.mark.autograd
+    @pytest.mark.parametrize("batch_dim", [None, 1, 3])
+    def test_with_autograd(self, batch_dim, seed):
+        """Test that the custom kernel works with Autograd."""
+        op, state, exp_out = self._state_and_expected(batch_dim, seed)
+        ag_state = qml.numpy.array(state)
+        out = apply_operation(op, ag_state, is_state_batched=batch_dim is not None, debugger=None)
+        assert qml.math.allclose(out, exp_out)
+
+    @pytest.mark.torch
+    @pytest.mark.parametrize("batch_dim", [None, 1, 3])
+    def test_with_torch(self, batch_dim, seed):
+        """Test that the custom kernel works with Torch."""
+        import torch
+
+        op, state, exp_out = self._state_and_expected(batch_dim, seed)
+        torch_state = torch.tensor(state, requires_grad=True)
+        out = apply_operation(
+            op, torch_state, is_state_batched=batch_dim is not None, debugger=None
+        )
+        assert qml.math.allclose(out, exp_out)
+
+    @staticmethod
+    def _summed_output(x, state, method):
+        """Apply a 9-wire ControlledQubitUnitary of RY(x) to the state with the given method
+        and sum the real part of the output."""
+        op = qml.ControlledQubitUnitary(
+            np.eye(2), wires=[0, 9, 3, 1, 8, 2, 7, 4, 6], control_values=[1, 0] * 4
+        )
+        # bind the trainable matrix the way tapes set their parameters
+        op.data = (qml.RY.compute_matrix(x),)
+        return qml.math.sum(qml.math.real(method(op, state)))
+
+    @pytest.mark.autograd
+    def test_gradient_autograd(self, seed):
+        """Test that the gradient through the base matrix is correct with Autograd."""
+        _, state, _ = self._state_and_expected(None, seed)
+        x = qml.numpy.array(0.4, requires_grad=True)
+        grad = qml.grad(self._summed_output)(x, state, apply_operation)
+        exp_grad = qml.grad(self._summed_output)(x, state, apply_operation_tensordot)
+        assert qml.math.allclose(grad, exp_grad)
+        assert not qml.math.allclose(grad, 0.0)
+
+    @pytest.mark.jax
+    def test_gradient_jax(self, seed):
+        """Test that the gradient through the base matrix is correct with JAX."""
+        import jax
+        from jax import numpy as jnp
+
+        _, state, _ = self._state_and_expected(None, seed)
+        state = jnp.array(state)
+        x = jnp.array(0.4)
+        grad = jax.grad(self._summed_output)(x, state, apply_operation)
+        exp_grad = jax.grad(self._summed_output)(x, state, apply_operation_tensordot)
+        assert qml.math.allclose(grad, exp_grad)
+        assert not qml.math.allclose(grad, 0.0)
+
+    @pytest.mark.torch
+    def test_gradient_torch(self, seed):
+        """Test that the gradient through the base matrix is correct with Torch."""
+        import torch
+
+        _, state, _ = self._state_and_expected(None, seed)
+        state = torch.tensor(state)
+        grads = []
+        for method in [apply_operation, apply_operation_tensordot]:
+            x = torch.tensor(0.4, requires_grad=True)
+            self._summed_output(x, state, method).backward()
+            grads.append(x.grad)
+        assert qml.math.allclose(grads[0], grads[1])
+        assert not qml.math.allclose(grads[0], 0.0)
+
+    @pytest.mark.tf
+    def test_gradient_tf(self, seed):
+        """Test that the gradient through the base matrix is correct with Tensorflow."""
+        import tensorflow as tf
+
+        _, state, _ = self._state_and_expected(None, seed)
+        state = tf.Variable(state)
+        grads = []
+        for method in [apply_operation, apply_operation_tensordot]:
+            x = tf.Variable(0.4, dtype=tf.float64)
+            with tf.GradientTape() as tape:
+                res = self._summed_output(x, state, method)
+            grads.append(tape.gradient(res, x))
+        assert qml.math.allclose(grads[0], grads[1])
+        assert not qml.math.allclose(grads[0], 0.0)
+
+
 @pytest.mark.tf
 class TestLargeTFCornerCases:
     """Test large corner cases for tensorflow."""
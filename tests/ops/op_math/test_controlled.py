@@ -816,11 +816,9 @@ special_non_par_op_decomps = [
             qml.T(wires=0),
             qml.T(wires=1),
             qml.CNOT(wires=[2, 1]),
-            qml.Hadamard(wires=0),
             qml.T(wires=2),
             qml.adjoint(qml.T(wires=1)),
             qml.CNOT(wires=[2, 1]),
-            qml.Hadamard(wires=0),
         ],
     ),
     (
@@ -840,11 +838,9 @@ special_non_par_op_decomps = [
             qml.T(wires=2),
             qml.T(wires=1),
             qml.CNOT(wires=[0, 1]),
-            qml.Hadamard(wires=2),
             qml.T(wires=0),
             qml.adjoint(qml.T(wires=1)),
             qml.CNOT(wires=[0, 1]),
-            qml.Hadamard(wires=[2]),
         ],
     ),
     (
@@ -1119,6 +1119,21 @@ class TestMCXDecomposition:
         ).T
         assert np.allclose(u, np.eye(2 ** (n_ctrl_wires + 1)))
 
+    def test_decomposition_with_no_workers_on_new_wires(self):
+        """Test that the decomposition without work wires queues new operators on the
+        given wires every time it is computed."""
+        wire_map = {0: "a", 1: "b", 2: "c", 3: "t"}
+        first = decompose_mcx(Wires([0, 1, 2]), Wires(3), work_wires=Wires([]))
+
+        with qml.queuing.AnnotatedQueue() as q:
+            second = decompose_mcx(Wires(["a", "b", "c"]), Wires("t"), work_wires=Wires([]))
+
+        assert len(q.queue) == len(second) == len(first)
+        for op1, op2, queued in zip(first, second, q.queue):
+            assert op2 is queued
+            assert op2 is not op1
+            qml.assert_equal(op2, op1.map_wires(wire_map))
+
 
 def test_ControlledQubitUnitary_has_decomposition_correct():
     """Test that ControlledQubitUnitary reports has_decomposition=False if it is False"""
@@ -784,6 +784,91 @@ class TestComputations:
         )
 
 
+@pytest.mark.parametrize(
+    "op_cls", [qml.CH, qml.CY, qml.CZ, qml.CSWAP, qml.CCZ, qml.CNOT, qml.Toffoli]
+)
+def test_constant_matrix_is_writable_copy(op_cls):
+    """Test that non-parametric controlled operators return a new writable matrix on every
+    call."""
+    mat = op_cls.compute_matrix()
+    expected = mat.copy()
+    mat[0, 0] = 0
+
+    assert mat.flags.writeable
+    assert np.array_equal(op_cls.compute_matrix(), expected)
+    assert qml.matrix(op_cls(wires=range(op_cls.num_wires))).flags.writeable
+
+
+@pytest.mark.parametrize(
+    "op_cls, params",
+    [
+        (qml.CRX, (0.4,)),
+        (qml.CRY, (0.4,)),
+        (qml.CRZ, (0.4,)),
+        (qml.CRot, (0.4, -0.2, 1.3)),
+        (qml.ControlledPhaseShift, (0.4,)),
+    ],
+)
+def test_scalar_angle_matrix_is_cached_copy(op_cls, params):
+    """Test that controlled rotations with scalar angles return writable copies of a
+    cached matrix."""
+    mat = op_cls.compute_matrix(*params)
+    mat[0, 0] = 0
+
+    assert mat.flags.writeable
+    expected = op_cls.compute_matrix(*(qml.numpy.array(p) for p in params))
+    assert np.allclose(op_cls.compute_matrix(*params), expected)
+
+
+@pytest.mark.parametrize("op_cls", [qml.CRZ, qml.ControlledPhaseShift])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("interface", ["numpy", "autograd"])
+def test_diagonal_matrix_broadcasted(op_cls, dtype, interface):
+    """Test that the broadcasted matrices of diagonal controlled rotations match the
+    eigenvalues placed on the diagonal."""
+    angles = qml.math.asarray(np.array([0.1, -0.7, 2.3], dtype=dtype), like=interface)
+    mat = op_cls.compute_matrix(angles)
+
+    assert mat.shape == (3, 4, 4)
+    assert mat.dtype == np.complex128
+    assert np.array_equal(mat, np.stack([np.diag(e) for e in op_cls.compute_eigvals(angles)]))
+
+
+@pytest.mark.parametrize("op_cls", [qml.CRZ, qml.ControlledPhaseShift])
+@pytest.mark.parametrize("angle", [0.4, -2, np.float32(1.3), np.int64(3)])
+def test_diagonal_eigvals_scalar(op_cls, angle):
+    """Test that the eigenvalues of diagonal controlled rotations with scalar angles match
+    the diagonal of their matrix."""
+    eigvals = op_cls.compute_eigvals(angle)
+
+    assert isinstance(eigvals, np.ndarray)
+    assert eigvals.dtype == np.complex128
+    assert np.allclose(eigvals, np.diag(op_cls.compute_matrix(qml.numpy.array(angle))))
+
+
+@pytest.mark.parametrize(
+    "phi, theta, omega",
+    [
+        (np.array([0.1, -0.7, 2.3]), 1.2, 0.5),
+        (0.1, np.array([1.2, 0.4, -0.3]), 0.5),
+        (0.1, 1.2, np.array([0.5, -1.1, 0.0])),
+        (np.array([0.1, -0.7, 2.3]), 1.2, np.array([0.5, -1.1, 0.0])),
+        (np.array([0.1, -0.7, 2.3]), np.array([1.2, 0.4, -0.3]), np.array([0.5, -1.1, 0.0])),
+    ],
+)
+def test_crot_matrix_numpy_broadcasted(phi, theta, omega):
+    """Test that the broadcasted NumPy matrix of CRot matches the stacked matrices of the single
+    parameter sets."""
+    mat = qml.CRot.compute_matrix(phi, theta, omega)
+
+    params = [np.full(3, p) if np.ndim(p) == 0 else p for p in (phi, theta, omega)]
+    expected = qml.math.stack(
+        [qml.CRot.compute_matrix(float(p), float(t), float(o)) for p, t, o in zip(*params)]
+    )
+    assert mat.shape == (3, 4, 4)
+    assert np.allclose(mat, expected)
+
+
 def test_simplify_crot():
     """Simplify CRot operations with different parameters."""
 
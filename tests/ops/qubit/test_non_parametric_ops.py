@@ -464,7 +464,7 @@ class TestDecompositions:
         op = qml.CCZ(wires=[0, 1, 2])
         res = op.decomposition()
 
-        assert len(res) == 15
+        assert len(res) == 13
 
         mats = []
 
@@ -831,6 +831,15 @@ class TestMultiControlledX:
         op_repr = qml.MultiControlledX(wires=wires, control_values=control_values).__repr__()
         assert op_repr == f"MultiControlledX(wires={wires}, control_values={control_values})"
 
+    def test_wires_cached(self):
+        """Test that the wires are computed once and stay correct for mapped copies."""
+        op = qml.MultiControlledX(wires=[0, 1, 2], work_wires=[3])
+
+        w = op.wires
+        assert op.wires is w
+        assert op.wires == Wires([0, 1, 2])
+        assert op.map_wires({0: "a", 2: "c"}).wires == Wires(["a", 1, "c"])
+
 
 period_two_ops = (
     qml.PauliX(0),